@@ -2,7 +2,6 @@ from collections import defaultdict
 from io import StringIO
 
 from conan import ConanFile
-from conan.internal.conan_app import ConanFileHelpers
 from conans.errors import ConanException
 from conans.model.conf import Conf
 from conans.model.layout import Folders, Infos
@@ -82,6 +81,9 @@ class MockCppInfo(object):
 
 class ConanFileMock(ConanFile):
     def __init__(self, settings=None, options=None, runner=None, display_name=""):
+        # Lazy import: conan_app drags the whole ConanApp machinery (loader, remote manager,
+        # hooks), which is not needed just to import the other mocks of this module
+        from conan.internal.conan_app import ConanFileHelpers
         self.display_name = display_name
         self._conan_node = None
         self.package_type = "unknown"
@@ -13,7 +13,6 @@ import time
 import traceback
 import uuid
 import zipfile
-from collections import OrderedDict
 from contextlib import contextmanager
 from urllib.parse import urlsplit, urlunsplit
 
@@ -397,6 +396,10 @@ def redirect_input(target):
 class TestClient:
     """ Test wrap of the conans application to launch tests in the same way as
     in command line
+
+    run() is not thread-safe: it redirects sys.stdout/stderr/stdin, changes the process
+    current directory and restores sys.modules on exit. Parallelize at the process level
+    with pytest-xdist (pytest -n) instead of running commands from several threads.
     """
     # Preventing Pytest collects any tests from here
     __test__ = False
@@ -406,7 +409,7 @@ class TestClient:
                  default_server_user=None, light=False, custom_commands_folder=None):
         """
         current_folder: Current execution folder
-        servers: dict of {remote_name: TestServer}
+        servers: dict of {remote_name: TestServer}, insertion order defines the remotes order
         logins is a list of (user, password) for auto input in order
         if required==> [("lasote", "mypass"), ("other", "otherpass")]
         """
@@ -430,14 +433,6 @@ class TestClient:
 
         self.requester_class = requester_class
 
-        if servers and len(servers) > 1 and not isinstance(servers, OrderedDict):
-            raise Exception(textwrap.dedent("""
-                Testing framework error: Servers should be an OrderedDict. e.g:
-                    servers = OrderedDict()
-                    servers["r1"] = server
-                    servers["r2"] = TestServer()
-            """))
-
         self.servers = servers or {}
         if servers is not False:  # Do not mess with registry remotes
             self.update_servers()
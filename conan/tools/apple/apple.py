@@ -6,22 +6,27 @@ from conan.tools.build import cmd_args_to_string
 from conan.errors import ConanException
 
 
+_APPLE_OS = frozenset({'Macos', 'iOS', 'watchOS', 'tvOS', 'visionOS'})
+
+_ARCH_MAP = {'x86': 'i386',
+             'x86_64': 'x86_64',
+             'armv7': 'armv7',
+             'armv8': 'arm64',
+             'armv8_32': 'arm64_32',
+             'armv8.3': 'arm64e',
+             'armv7s': 'armv7s',
+             'armv7k': 'armv7k'}
+
+
 def is_apple_os(conanfile):
     """returns True if OS is Apple one (Macos, iOS, watchOS, tvOS or visionOS)"""
     os_ = conanfile.settings.get_safe("os")
-    return str(os_) in ['Macos', 'iOS', 'watchOS', 'tvOS', 'visionOS']
+    return str(os_) in _APPLE_OS
 
 
 def _to_apple_arch(arch, default=None):
     """converts conan-style architecture into Apple-style arch"""
-    return {'x86': 'i386',
-            'x86_64': 'x86_64',
-            'armv7': 'armv7',
-            'armv8': 'arm64',
-            'armv8_32': 'arm64_32',
-            'armv8.3': 'arm64e',
-            'armv7s': 'armv7s',
-            'armv7k': 'armv7k'}.get(str(arch), default)
+    return _ARCH_MAP.get(str(arch), default)
 
 
 def to_apple_arch(conanfile, default=None):
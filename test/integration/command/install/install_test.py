@@ -2,7 +2,6 @@ import json
 import os
 import re
 import textwrap
-from collections import OrderedDict
 
 import pytest
 
@@ -293,9 +292,9 @@ def test_install_no_remotes(client):
 
 
 def test_install_skip_disabled_remote():
-    client = TestClient(servers=OrderedDict({"default": TestServer(),
-                                             "server2": TestServer(),
-                                             "server3": TestServer()}),
+    client = TestClient(servers={"default": TestServer(),
+                                 "server2": TestServer(),
+                                 "server3": TestServer()},
                         inputs=2*["admin", "password"])
     client.save({"conanfile.py": GenConanfile()})
     client.run("create . --name=pkg --version=0.1 --user=lasote --channel=testing")
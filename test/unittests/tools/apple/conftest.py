@@ -0,0 +1,13 @@
+import pytest
+
+from conan.test.utils.mocks import ConanFileMock
+
+
+@pytest.fixture(scope="module")
+def conanfile():
+    """
+    ConanFileMock shared by all the tests of a module (and pytest-xdist worker). Tests must
+    assign every attribute they read (e.g. conanfile.settings) instead of relying on values left
+    by a previous test. Tests that modify options or folders should build their own ConanFileMock
+    """
+    return ConanFileMock()
@@ -1,3 +1,6 @@
+"""
+Tests in this module must stay independent of each other to run in pytest-xdist (pytest -n)
+"""
 import mock
 import pytest
 import textwrap
@@ -5,49 +8,61 @@ import textwrap
 from conan.internal.internal_tools import is_universal_arch
 from conans.errors import ConanException
 from conan.test.utils.mocks import ConanFileMock, MockSettings, MockOptions
-from conan.test.utils.test_files import temp_folder
 from conan.tools.apple import is_apple_os, to_apple_arch, fix_apple_shared_install_name, XCRun
-from conan.tools.apple.apple import _get_dylib_install_name
+from conan.tools.apple.apple import _get_dylib_install_name, _APPLE_OS, _ARCH_MAP
 
 
-def test_tools_apple_is_apple_os():
-    conanfile = ConanFileMock()
+apple_os_cases = [("Macos", True),
+                  ("iOS", True),
+                  ("watchOS", True),
+                  ("tvOS", True),
+                  ("visionOS", True),
+                  ("Windows", False),
+                  ("Linux", False),
+                  ("FreeBSD", False)]
 
-    conanfile.settings = MockSettings({"os": "Macos"})
-    assert is_apple_os(conanfile) == True
+apple_arch_cases = [("x86", "i386"),
+                    ("x86_64", "x86_64"),
+                    ("armv7", "armv7"),
+                    ("armv8", "arm64"),
+                    ("armv8_32", "arm64_32"),
+                    ("armv8.3", "arm64e"),
+                    ("armv7s", "armv7s"),
+                    ("armv7k", "armv7k")]
 
-    conanfile.settings = MockSettings({"os": "watchOS"})
-    assert is_apple_os(conanfile) == True
 
-    conanfile.settings = MockSettings({"os": "Windows"})
-    assert is_apple_os(conanfile) == False
+@pytest.mark.parametrize("os_name,expected", apple_os_cases)
+def test_tools_apple_is_apple_os(conanfile, os_name, expected):
+    conanfile.settings = MockSettings({"os": os_name})
+    assert is_apple_os(conanfile) is expected
 
 
-def test_tools_apple_to_apple_arch():
-    conanfile = ConanFileMock()
+@pytest.mark.parametrize("arch,expected", apple_arch_cases + [("sparc", None)])
+def test_tools_apple_to_apple_arch(conanfile, arch, expected):
+    conanfile.settings = MockSettings({"arch": arch})
+    assert to_apple_arch(conanfile) == expected
 
-    conanfile.settings = MockSettings({"arch": "armv8"})
-    assert to_apple_arch(conanfile) == "arm64"
 
-    conanfile.settings = MockSettings({"arch": "x86_64"})
-    assert to_apple_arch(conanfile) == "x86_64"
+def test_tools_apple_tables_covered():
+    # Adding a new Apple OS or arch must come with its test case above
+    assert _APPLE_OS == {os_name for os_name, expected in apple_os_cases if expected}
+    assert _ARCH_MAP == dict(apple_arch_cases)
 
 
-def test_fix_shared_install_name_no_libraries():
+def test_fix_shared_install_name_no_libraries(tmp_path):
     conanfile = ConanFileMock()
     conanfile.options = MockOptions({"shared": True})
     conanfile.settings = MockSettings({"os": "Macos"})
-    conanfile.folders.set_base_package(temp_folder())
+    conanfile.folders.set_base_package(str(tmp_path))
 
-    with pytest.raises(Exception) as e:
+    with pytest.raises(ConanException, match="not found inside package folder"):
         fix_apple_shared_install_name(conanfile)
-        assert "not found inside package folder" in str(e.value)
 
 
-def test_xcrun_public_settings():
+def test_xcrun_public_settings(conanfile):
     # https://github.com/conan-io/conan/issues/12485
-    conanfile = ConanFileMock()
     conanfile.settings = MockSettings({"os": "watchOS"})
+    conanfile.settings_target = None
 
     xcrun = XCRun(conanfile, use_settings_target=True)
     settings = xcrun.settings